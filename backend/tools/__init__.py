@@ -5,12 +5,20 @@ from .budget_manager import BudgetManagerTool
 from .investment_analyzer import InvestmentAnalyzerTool
 from .goal_tracker import GoalTrackerTool
 from .financial_insights import FinancialInsightsTool
+from .advanced_financial_planner import AdvancedFinancialPlannerTool
+from .graph_visualization import GraphVisualizationTool
+from .market_intelligence import MarketIntelligenceTool
+from .risk_assessment import RiskAssessmentTool
 
 __all__ = [
     "DataLoader",
     "TransactionAnalyzerTool",
-    "BudgetManagerTool", 
+    "BudgetManagerTool",
     "InvestmentAnalyzerTool",
     "GoalTrackerTool",
-    "FinancialInsightsTool"
+    "FinancialInsightsTool",
+    "AdvancedFinancialPlannerTool",
+    "GraphVisualizationTool",
+    "MarketIntelligenceTool",
+    "RiskAssessmentTool"
 ]
\ No newline at end of file
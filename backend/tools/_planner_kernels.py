@@ -0,0 +1,65 @@
+"""Numba-compiled numeric kernels for the advanced financial planner.
+
+The planner stays a thin pandas-to-ndarray marshaller; the scalar
+arithmetic runs here on raw float64 arrays. Kernels are compiled with
+cache=True so the JIT cost is paid once per machine. Without numba the
+module swaps in vectorized numpy reductions instead - an interpreted
+per-element loop would be slower than the masked scans it replaced.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def split_income_expenses(amounts):
+        """Single-pass branchless income/expense totals over raw amounts"""
+        total = 0.0
+        abs_sum = 0.0
+        for i in range(amounts.shape[0]):
+            value = amounts[i]
+            total += value
+            abs_sum += value if value >= 0.0 else -value
+        income = (total + abs_sum) * 0.5
+        expenses = (abs_sum - total) * 0.5
+        return income, expenses
+else:
+    def split_income_expenses(amounts):
+        """Branchless income/expense totals via two numpy reductions"""
+        total = float(amounts.sum())
+        abs_sum = float(np.abs(amounts).sum())
+        income = (total + abs_sum) * 0.5
+        expenses = (abs_sum - total) * 0.5
+        return income, expenses
+
+
+def planner_scalars(amounts, n_months):
+    """Fused computation of the planner's core scalar metrics.
+
+    Returns (income, expenses, savings_rate, monthly_expenses,
+    annual_expenses) from one pass over the amount array.
+    """
+    income, expenses = split_income_expenses(amounts)
+
+    savings_rate = 0.0
+    if income > 0.0:
+        savings_rate = (income - expenses) / income * 100.0
+
+    monthly_expenses = 0.0
+    if n_months > 0:
+        monthly_expenses = expenses / n_months
+
+    annual_expenses = monthly_expenses * 12.0
+
+    return income, expenses, savings_rate, monthly_expenses, annual_expenses
+
+
+if HAS_NUMBA:
+    # The scalar derivation is identical either way; only compile it when
+    # the inner split call is also a compiled kernel
+    planner_scalars = njit(cache=True)(planner_scalars)
@@ -0,0 +1,99 @@
+"""Numba-compiled numeric kernels for the risk assessment tool.
+
+The tool marshals pandas data into raw float64/int64 arrays and the
+per-row arithmetic runs here. Kernels compile with cache=True so the
+JIT cost is paid once per machine, and the module degrades to plain
+Python when numba is not installed.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is unavailable"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def income_vol_kernel(amounts, month_codes):
+    """Coefficient of variation of monthly income totals.
+
+    Buckets positive amounts by month code in one dict-free radix pass,
+    then reduces mean and population std over the active months.
+    """
+    n = amounts.shape[0]
+    if n == 0:
+        return 0.0
+
+    lo = month_codes[0]
+    hi = month_codes[0]
+    for i in range(n):
+        code = month_codes[i]
+        if code < lo:
+            lo = code
+        if code > hi:
+            hi = code
+
+    sums = np.zeros(hi - lo + 1)
+    seen = np.zeros(hi - lo + 1, dtype=np.bool_)
+    for i in range(n):
+        if amounts[i] > 0.0:
+            idx = month_codes[i] - lo
+            sums[idx] += amounts[i]
+            seen[idx] = True
+
+    total = 0.0
+    count = 0
+    for j in range(sums.shape[0]):
+        if seen[j]:
+            total += sums[j]
+            count += 1
+    if count == 0:
+        return 0.0
+    mean = total / count
+    if mean <= 0.0:
+        return 0.0
+
+    variance = 0.0
+    for j in range(sums.shape[0]):
+        if seen[j]:
+            delta = sums[j] - mean
+            variance += delta * delta
+    return (variance / count) ** 0.5 / mean
+
+
+@njit(cache=True)
+def concentration_kernel(values):
+    """Largest value as a fraction of the total, 0.0 when degenerate"""
+    total = 0.0
+    largest = 0.0
+    for i in range(values.shape[0]):
+        value = values[i]
+        total += value
+        if value > largest:
+            largest = value
+    if total <= 0.0:
+        return 0.0
+    return largest / total
+
+
+@njit(cache=True)
+def budget_overrun_kernel(percentages):
+    """Fraction of budget categories whose usage exceeds 100 percent"""
+    n = percentages.shape[0]
+    if n == 0:
+        return 0.0
+    overruns = 0
+    for i in range(n):
+        if percentages[i] > 100.0:
+            overruns += 1
+    return overruns / n
@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Dict, Any
+from agents.nodes import FinanceAgentState
+
+# The workflow graph, capabilities, and tool descriptions are invariant -
+# they live at module scope so each call returns references instead of
+# rebuilding the nested dicts and ASCII art on every agent turn. They are
+# plain dicts because the references land in the JSON response payload
+# (immutable by convention, like _SECTOR_MAPPING in investment_analyzer).
+
+_WORKFLOW_GRAPH = """
+🤖 Dynamic Personal Finance Agent Workflow:
+
+┌─────────────────┐
+│   User Query    │
+└─────────┬───────┘
+          │
+┌─────────▼───────┐
+│ Intent Classify │ ← Groq-powered intent detection
+└─────────┬───────┘
+          │
+┌─────────▼───────┐
+│  Tool Routing   │ ← Keyword + context-aware dispatch
+└─────────┬───────┘
+          │
+┌─────────▼───────┐
+│ Analysis Tools  │ ← Transactions, budget, investments, goals
+└─────────┬───────┘
+          │
+┌─────────▼───────┐
+│ Response Synth  │ ← LLM response generation with context
+└─────────────────┘
+"""
+
+_AGENT_CAPABILITIES = {
+    "intent_classification": "LLM-powered categorization of user queries",
+    "expense_tracking": "Transaction analysis with category and merchant breakdowns",
+    "budget_analysis": "Budget tracking, overspending alerts, and adherence scoring",
+    "investment_analysis": "Portfolio performance, allocation, and market data",
+    "goal_tracking": "Financial goal progress and timeline monitoring",
+    "financial_insights": "Cross-data comprehensive insights and health scoring",
+    "advanced_planning": "Cash flow, emergency fund, and retirement planning",
+    "conversational_memory": "Stateful multi-turn conversations with context"
+}
+
+_TOOL_DESCRIPTIONS = {
+    "transaction_analyzer": "Analyzes spending patterns from transaction history",
+    "budget_manager": "Tracks budget performance and identifies overspending",
+    "investment_analyzer": "Evaluates portfolio performance and allocation",
+    "goal_tracker": "Monitors progress toward financial goals",
+    "financial_insights": "Generates comprehensive financial reports",
+    "advanced_financial_planner": "Performs holistic financial planning analysis",
+    "graph_visualization": "Exposes the agent architecture for transparency"
+}
+
+_GRAPH_STRUCTURE = {
+    "nodes": [
+        {"id": "user_query", "type": "input", "label": "User Query"},
+        {"id": "intent_classifier", "type": "llm", "label": "Intent Classifier"},
+        {"id": "tool_router", "type": "router", "label": "Tool Routing"},
+        {"id": "analysis_tools", "type": "tools", "label": "Analysis Tools"},
+        {"id": "response_synthesizer", "type": "llm", "label": "Response Synthesizer"}
+    ],
+    "edges": [
+        {"from": "user_query", "to": "intent_classifier"},
+        {"from": "intent_classifier", "to": "tool_router"},
+        {"from": "tool_router", "to": "analysis_tools"},
+        {"from": "analysis_tools", "to": "response_synthesizer"}
+    ]
+}
+
+class GraphVisualizationTool:
+    """Exposes the agent workflow architecture for transparency queries"""
+
+    def __call__(self, state: FinanceAgentState) -> FinanceAgentState:
+        """Main entry point for workflow visualization"""
+        analysis = {
+            "analysis_type": "Agent Workflow Visualization",
+            "workflow_graph": self._generate_workflow_graph(),
+            "agent_capabilities": self._get_agent_capabilities(),
+            "tool_descriptions": self._get_tool_descriptions(),
+            "graph_structure": self._get_graph_structure(),
+            "execution_statistics": self._generate_execution_stats(state)
+        }
+
+        state["analysis_results"]["graph_visualization"] = analysis
+        state["tools_used"].append("graph_visualization")
+        return state
+
+    def _generate_workflow_graph(self) -> str:
+        """Return the ASCII workflow diagram"""
+        return _WORKFLOW_GRAPH
+
+    def _get_agent_capabilities(self) -> Dict[str, str]:
+        """Return the shared capability descriptions"""
+        return _AGENT_CAPABILITIES
+
+    def _get_tool_descriptions(self) -> Dict[str, str]:
+        """Return the shared tool descriptions"""
+        return _TOOL_DESCRIPTIONS
+
+    def _get_graph_structure(self) -> Dict[str, Any]:
+        """Return the shared graph structure"""
+        return _GRAPH_STRUCTURE
+
+    def _generate_execution_stats(self, state: FinanceAgentState) -> Dict[str, Any]:
+        """Summarize execution details for the current session"""
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "tools_used_this_session": list(state.get("tools_used", [])),
+            "intent": state.get("intent", ""),
+            "analyses_completed": len(state.get("analysis_results", {})),
+            "conversation_turns": len(state.get("messages", []))
+        }
@@ -0,0 +1,160 @@
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Any
+from agents.nodes import FinanceAgentState
+
+# Generator-based RNG: created once at import, cheaper per draw than the
+# legacy np.random.* global-state functions
+_RNG = np.random.default_rng()
+
+# The market-intelligence payloads below are static editorial content.
+# They live at module scope so each analysis returns shared references
+# instead of re-literalizing the nested dicts per call. They stay plain
+# dicts because the references land in the JSON response payload
+# (immutable by convention, like _SECTOR_MAPPING in investment_analyzer).
+
+_MARKET_OVERVIEW = {
+    "market_sentiment": "cautiously optimistic",
+    "volatility_level": "moderate",
+    "major_indices": {
+        "S&P 500": "trending upward with technology leadership",
+        "NASDAQ": "outperforming on AI and semiconductor strength",
+        "Dow Jones": "steady gains led by industrials"
+    },
+    "key_themes": [
+        "AI-driven productivity gains across sectors",
+        "Interest rate policy normalization",
+        "Resilient consumer spending"
+    ]
+}
+
+_ECONOMIC_INDICATORS = {
+    "inflation": {"trend": "moderating", "impact": "supportive of equity valuations"},
+    "employment": {"trend": "stable", "impact": "sustains consumer demand"},
+    "interest_rates": {"trend": "plateauing", "impact": "favorable for growth assets"},
+    "gdp_growth": {"trend": "steady", "impact": "constructive backdrop for earnings"}
+}
+
+_SECTORS = (
+    "Technology",
+    "Healthcare",
+    "Financials",
+    "Consumer Discretionary",
+    "Consumer Staples",
+    "Energy",
+    "Industrials",
+    "Utilities"
+)
+
+_SECTOR_DRIVERS = {
+    "Technology": "AI adoption and cloud migration",
+    "Healthcare": "Innovation pipeline and demographics",
+    "Financials": "Net interest margins and credit quality",
+    "Consumer Discretionary": "Consumer confidence and spending",
+    "Consumer Staples": "Pricing power and defensive demand",
+    "Energy": "Commodity prices and capital discipline",
+    "Industrials": "Infrastructure spending and reshoring",
+    "Utilities": "Rate sensitivity and grid investment"
+}
+
+_OPPORTUNITIES = (
+    {
+        "theme": "AI infrastructure",
+        "rationale": "Sustained enterprise investment in compute and data platforms",
+        "risk_level": "moderate"
+    },
+    {
+        "theme": "Dividend aristocrats",
+        "rationale": "Quality income amid rate normalization",
+        "risk_level": "low"
+    },
+    {
+        "theme": "Healthcare innovation",
+        "rationale": "Undervalued pipeline assets after sector rotation",
+        "risk_level": "moderate"
+    }
+)
+
+_RISK_ALERTS = (
+    {
+        "risk": "Concentration in mega-cap technology",
+        "severity": "medium",
+        "mitigation": "Diversify across sectors and market caps"
+    },
+    {
+        "risk": "Geopolitical supply-chain disruption",
+        "severity": "medium",
+        "mitigation": "Favor companies with regional supply flexibility"
+    }
+)
+
+_MARKET_FORECAST = {
+    "base_case": "Moderate gains with broadening market participation",
+    "bull_case": "Soft landing with accelerating earnings growth",
+    "bear_case": "Sticky inflation forcing renewed tightening",
+    "recommended_posture": "Stay invested with balanced sector exposure"
+}
+
+class MarketIntelligenceTool:
+    """Provides market overview, sector analysis, and investment themes"""
+
+    def __call__(self, state: FinanceAgentState) -> FinanceAgentState:
+        """Main entry point for market intelligence analysis"""
+        analysis = self._market_analysis()
+
+        state["analysis_results"]["market_intelligence"] = analysis
+        state["tools_used"].append("market_intelligence")
+        return state
+
+    def _market_analysis(self) -> Dict[str, Any]:
+        """Assemble the full market intelligence payload"""
+        return {
+            "analysis_type": "Market Intelligence",
+            "generated_at": datetime.now().isoformat(),
+            "market_overview": self._get_market_overview(),
+            "sector_analysis": self._get_sector_analysis(),
+            "economic_indicators": self._get_economic_indicators(),
+            "opportunities": self._get_opportunities(),
+            "risk_alerts": self._get_risk_alerts(),
+            "market_forecast": self._get_market_forecast()
+        }
+
+    def _get_market_overview(self) -> Dict[str, Any]:
+        """Return the shared market overview payload"""
+        return _MARKET_OVERVIEW
+
+    def _get_sector_analysis(self) -> Dict[str, Any]:
+        """Simulated sector performance snapshot"""
+        # One vectorized draw and three broadcast rounds for all sectors
+        changes = _RNG.uniform(-3.0, 4.0, size=len(_SECTORS))
+        daily = np.round(changes, 2)
+        weekly = np.round(changes * 3.2, 2)
+        monthly = np.round(changes * 8.5, 2)
+        outlooks = np.where(changes > 0, "positive", "negative")
+
+        return {
+            sector: {
+                "daily_change": float(daily[i]),
+                "weekly_change": float(weekly[i]),
+                "monthly_change": float(monthly[i]),
+                "outlook": str(outlooks[i]),
+                "key_driver": _SECTOR_DRIVERS[sector]
+            }
+            for i, sector in enumerate(_SECTORS)
+        }
+
+    def _get_economic_indicators(self) -> Dict[str, Any]:
+        """Return the shared economic indicator payload"""
+        return _ECONOMIC_INDICATORS
+
+    def _get_opportunities(self) -> List[Dict[str, Any]]:
+        """Return the shared investment opportunity themes"""
+        return list(_OPPORTUNITIES)
+
+    def _get_risk_alerts(self) -> List[Dict[str, Any]]:
+        """Return the shared market risk alerts"""
+        return list(_RISK_ALERTS)
+
+    def _get_market_forecast(self) -> Dict[str, Any]:
+        """Return the shared forecast scenarios"""
+        return _MARKET_FORECAST
@@ -0,0 +1,472 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import Dict, List, Any, Optional
+from agents.nodes import FinanceAgentState
+from tools.data_loader import DataLoader
+from tools._risk_kernels import (
+    HAS_NUMBA,
+    income_vol_kernel,
+    concentration_kernel,
+    budget_overrun_kernel
+)
+
+@dataclass(slots=True)
+class _TxCache:
+    """Per-request transaction scans shared by every risk helper.
+
+    Boolean masks over the amount column and the income/expense totals
+    are computed once here; without this each helper re-filtered the
+    DataFrame, allocating a fresh copy per boolean index.
+    """
+    amt: np.ndarray
+    months: np.ndarray
+    n_months: int
+    pos: np.ndarray
+    neg: np.ndarray
+    income_total: float
+    expense_total: float
+    income_source_count: int
+
+    @classmethod
+    def from_frame(cls, transactions) -> "_TxCache":
+        amt = transactions['amount'].to_numpy()
+        months = transactions['date'].values.astype('datetime64[M]')
+        pos = amt > 0
+        neg = amt < 0
+        return cls(
+            amt=amt,
+            months=months,
+            n_months=int(np.unique(months).size),
+            pos=pos,
+            neg=neg,
+            income_total=float(amt[pos].sum()),
+            # Sign-flip inline on the masked view; abs() on the summed
+            # float would be a redundant extra step
+            expense_total=float(-amt[neg].sum()),
+            # nunique counts through pandas' C-level hash table without
+            # materializing the unique object array that unique() builds
+            income_source_count=int(transactions.loc[pos, 'description'].nunique())
+        )
+
+@dataclass
+class RiskContext:
+    """Lazily-evaluated per-request view over the raw financial contexts.
+
+    Derived values are cached_property results computed on first access
+    and shared by every helper, so no input is scanned more than once
+    per request no matter how many consumers touch it.
+    """
+    transactions: Any
+    budget: Dict
+    investments: List[Dict]
+
+    @cached_property
+    def tx(self) -> Optional[_TxCache]:
+        if self.transactions is None or self.transactions.empty:
+            return None
+        return _TxCache.from_frame(self.transactions)
+
+    @cached_property
+    def _portfolio_arrays(self):
+        """Single pass converting the portfolio from AoS to SoA.
+
+        Returns (values, lowercase symbols, percentage changes); every
+        numeric consumer reduces over these contiguous arrays instead of
+        re-walking the list of dicts.
+        """
+        n = len(self.investments)
+        values = np.empty(n, dtype=np.float64)
+        symbols = np.empty(n, dtype=object)
+        changes = np.empty(n, dtype=np.float64)
+        for i, inv in enumerate(self.investments):
+            values[i] = inv.get("market_value", 0)
+            symbols[i] = inv.get("symbol", "").lower()
+            changes[i] = inv.get("percentage_change", 0)
+        return values, symbols.astype(str), changes
+
+    @property
+    def portfolio_values(self) -> np.ndarray:
+        return self._portfolio_arrays[0]
+
+    @property
+    def portfolio_symbols(self) -> np.ndarray:
+        return self._portfolio_arrays[1]
+
+    @property
+    def portfolio_changes(self) -> np.ndarray:
+        return self._portfolio_arrays[2]
+
+    @cached_property
+    def current_month_key(self) -> str:
+        """Current month as YYYY-MM, formatted once per request.
+
+        The f-string is several times cheaper than strftime and the key
+        cannot change for the life of a request.
+        """
+        today = datetime.now()
+        return f"{today.year:04d}-{today.month:02d}"
+
+    @cached_property
+    def emergency_months(self) -> float:
+        """Months of average spending covered by liquid investment assets"""
+        tx = self.tx
+        if tx is None or not tx.neg.any():
+            return 0.0
+
+        liquid_assets = float(self.portfolio_values.sum())
+        # Grouping stays on plain datetime64[M] keys - Period/categorical
+        # keys would hit pandas' slow path that enumerates unobserved
+        # groups - and sort=False skips an unneeded key sort since only
+        # the mean of the groups is consumed
+        monthly_spending = (
+            pd.Series(tx.amt[tx.neg])
+            .groupby(tx.months[tx.neg], observed=True, sort=False)
+            .sum()
+        )
+        avg_monthly_expenses = -monthly_spending.mean()
+        if avg_monthly_expenses <= 0:
+            return 0.0
+        return float(liquid_assets / avg_monthly_expenses)
+
+    @cached_property
+    def income_volatility(self) -> float:
+        """Coefficient of variation of monthly income (0 = perfectly stable)"""
+        tx = self.tx
+        if tx is None or not tx.pos.any():
+            return 0.0
+
+        month_codes = tx.months.view(np.int64)
+        if HAS_NUMBA:
+            # One radix pass in the kernel replaces the pandas groupby
+            # plus the std/mean reductions
+            return float(income_vol_kernel(tx.amt, month_codes))
+
+        # Without numba the kernel would run interpreted, so group with
+        # np.bincount instead: O(n) C-level accumulation over zero-based
+        # integer month codes, no Period or hash-table overhead
+        codes = month_codes[tx.pos] - month_codes.min()
+        monthly_income = np.bincount(codes, weights=tx.amt[tx.pos])
+        monthly_income = monthly_income[monthly_income > 0]
+        mean_income = monthly_income.mean()
+        if mean_income <= 0:
+            return 0.0
+        return float(monthly_income.std() / mean_income)
+
+    @cached_property
+    def liquidity_risk(self) -> float:
+        """Liquidity risk on a 0-1 scale; 6+ months of coverage is fully liquid"""
+        if self.tx is None:
+            return 0.0
+        return max(0.0, 1.0 - self.emergency_months / 6)
+
+    @cached_property
+    def concentration(self) -> float:
+        """Largest position as a fraction of total portfolio value"""
+        if self.portfolio_values.size == 0:
+            return 0.0
+        # Fused max+sum in one compiled pass over the value array
+        return float(concentration_kernel(self.portfolio_values))
+
+    @cached_property
+    def budget_overrun_rate(self) -> float:
+        """Fraction of budget categories currently overrun"""
+        budget = self.budget
+        if not budget or not budget.get("monthly_budgets"):
+            return 0.0
+
+        current_budget = budget["monthly_budgets"].get(self.current_month_key)
+        if not current_budget or not current_budget.get("categories"):
+            return 0.0
+
+        categories = current_budget["categories"]
+        # One array extraction, then the overrun count is a vector
+        # reduction instead of a per-category Python counter
+        percentages = np.fromiter(
+            (data.get("percentage_used", 0) for data in categories.values()),
+            dtype=np.float64, count=len(categories)
+        )
+        return float(budget_overrun_kernel(percentages))
+
+    # Capped sub-scores: each evaluates to 0.0 when its inputs are
+    # absent, so the overall score is a plain sum with no branching
+
+    @cached_property
+    def income_vol_score(self) -> float:
+        return min(25.0, self.income_volatility * 50)
+
+    @cached_property
+    def liquidity_score(self) -> float:
+        return min(25.0, self.liquidity_risk * 25)
+
+    @cached_property
+    def concentration_score(self) -> float:
+        return min(25.0, self.concentration * 50)
+
+    @cached_property
+    def budget_score(self) -> float:
+        return min(25.0, self.budget_overrun_rate * 50)
+
+# Advisory payloads. Entries with no dynamic fields are plain dicts
+# built once at import and shared by reference - they end up in the
+# JSON response, so they stay ordinary dicts (immutable by convention,
+# like _SECTOR_MAPPING in investment_analyzer). Entries that
+# interpolate numbers are template functions so the f-string formatting
+# runs only when the branch that needs them actually fires.
+
+_VULN_SINGLE_INCOME = {
+    "type": "single_income_source",
+    "severity": "high",
+    "description": "All income comes from a single source"
+}
+
+def _vuln_emergency_fund(months: float) -> Dict[str, str]:
+    return {
+        "type": "insufficient_emergency_fund",
+        "severity": "high",
+        "description": f"Emergency fund covers only {months:.1f} months of expenses"
+    }
+
+def _vuln_concentration(concentration: float) -> Dict[str, str]:
+    return {
+        "type": "portfolio_concentration",
+        "severity": "medium",
+        "description": f"Largest position is {concentration * 100:.1f}% of the portfolio"
+    }
+
+def _strategy_emergency_fund(months: float) -> Dict[str, str]:
+    return {
+        "priority": "high",
+        "strategy": "Build emergency fund",
+        "detail": f"Increase coverage from {months:.1f} to 6 months of expenses"
+    }
+
+_STRATEGY_DIVERSIFY_INCOME = {
+    "priority": "medium",
+    "strategy": "Diversify income",
+    "detail": "Develop a secondary income stream to reduce single-source dependence"
+}
+
+_STRATEGY_REBALANCE = {
+    "priority": "medium",
+    "strategy": "Rebalance portfolio",
+    "detail": "Trim the largest position to reduce concentration risk"
+}
+
+_STRATEGY_BUDGET_ADHERENCE = {
+    "priority": "medium",
+    "strategy": "Tighten budget adherence",
+    "detail": "Multiple budget categories are overrun this month"
+}
+
+def _need_disability_insurance(monthly_income: float) -> Dict[str, str]:
+    return {
+        "type": "disability_insurance",
+        "rationale": f"Protects roughly ${monthly_income:,.0f}/month of income"
+    }
+
+_NEED_UMBRELLA = {
+    "type": "umbrella_liability",
+    "rationale": "Asset base is large enough to warrant extra liability coverage"
+}
+
+@lru_cache(maxsize=1)
+def _loader() -> DataLoader:
+    """Process-wide DataLoader shared by every tool instance"""
+    return DataLoader()
+
+class RiskAssessmentTool:
+    """Assesses financial risk across income, portfolio, liquidity, and budget"""
+
+    def __init__(self):
+        self.data_loader = _loader()
+
+    def __call__(self, state: FinanceAgentState) -> FinanceAgentState:
+        """Main entry point for risk assessment"""
+        context = state.get("context", {})
+
+        ctx = RiskContext(
+            transactions=context.get("transactions"),
+            budget=context.get("budget", {}),
+            investments=context.get("investments", [])
+        )
+        analysis = self._comprehensive_risk_analysis(ctx)
+
+        state["analysis_results"]["risk_assessment"] = analysis
+        state["tools_used"].append("risk_assessment")
+        return state
+
+    def _comprehensive_risk_analysis(self, ctx: RiskContext) -> Dict[str, Any]:
+        """Run the full risk analysis across all available data"""
+        return {
+            "analysis_type": "Risk Assessment",
+            "generated_at": datetime.now().isoformat(),
+            "overall_risk_score": self._calculate_overall_risk_score(ctx),
+            "risk_categories": self._analyze_risk_categories(ctx),
+            "portfolio_diversification": self._analyze_portfolio_diversification(ctx),
+            "stress_tests": self._perform_stress_tests(ctx),
+            "vulnerabilities": self._assess_vulnerabilities(ctx),
+            "mitigation_strategies": self._generate_risk_mitigation_strategies(ctx),
+            "insurance_needs": self._analyze_insurance_needs(ctx)
+        }
+
+    def _analyze_risk_categories(self, ctx: RiskContext) -> Dict[str, Any]:
+        """Score each major risk category on a 0-100 scale"""
+        income_score = min(100, int(ctx.income_volatility * 200))
+
+        # Two numpy reductions replace the per-position Python loop
+        swings = np.abs(ctx.portfolio_changes)
+        market_score = min(100, int(
+            20 * np.count_nonzero(swings > 20)
+            + 10 * np.count_nonzero((swings > 10) & (swings <= 20))
+        ))
+
+        liquidity_score = int(ctx.liquidity_risk * 100)
+        budget_score = int(ctx.budget_overrun_rate * 100)
+
+        return {
+            "income_risk": {"score": income_score, "level": self._risk_level(income_score)},
+            "market_risk": {"score": market_score, "level": self._risk_level(market_score)},
+            "liquidity_risk": {"score": liquidity_score, "level": self._risk_level(liquidity_score)},
+            "budget_risk": {"score": budget_score, "level": self._risk_level(budget_score)}
+        }
+
+    def _analyze_portfolio_diversification(self, ctx: RiskContext) -> Dict[str, Any]:
+        """Break the portfolio down by asset class and concentration"""
+        if not ctx.investments:
+            return {"status": "No investment data available"}
+
+        # Vectorized classification: substring tests run as numpy string
+        # ops over the whole symbol array instead of per-dict Python tests
+        vals, syms = ctx.portfolio_values, ctx.portfolio_symbols
+
+        bonds = (np.char.find(syms, "bond") >= 0) | (np.char.find(syms, "treasury") >= 0)
+        stocks = ~bonds & (
+            (np.char.find(syms, "stock") >= 0)
+            | (np.char.find(syms, "equity") >= 0)
+            | (np.char.find(syms, "etf") >= 0)
+        )
+        # Group-by-class sum as one weighted bincount over integer codes
+        # (0=bonds, 1=stocks, 2=other) instead of three masked sums
+        codes = np.full(syms.size, 2, dtype=np.intp)
+        codes[bonds] = 0
+        codes[stocks] = 1
+        allocation = np.bincount(codes, weights=vals, minlength=3)
+        asset_types = {
+            "bonds": float(allocation[0]),
+            "stocks": float(allocation[1]),
+            "other": float(allocation[2])
+        }
+
+        total_value = float(vals.sum())
+        concentration = float(vals.max() / total_value) if total_value > 0 else 0.0
+        diversification_score = max(0, int((1 - concentration) * 100))
+
+        return {
+            "asset_allocation": {k: round(v, 2) for k, v in asset_types.items()},
+            "total_value": round(total_value, 2),
+            "position_count": len(ctx.investments),
+            "largest_position_pct": round(concentration * 100, 1),
+            "diversification_score": diversification_score
+        }
+
+    def _perform_stress_tests(self, ctx: RiskContext) -> Dict[str, Any]:
+        """Model the impact of common adverse financial scenarios"""
+        if ctx.tx is None:
+            return {"status": "Insufficient data for stress testing"}
+
+        # Both totals and the month count already live in the cache, so
+        # the monthly figures are two plain divisions
+        monthly_income = ctx.tx.income_total / ctx.tx.n_months
+        monthly_expenses = ctx.tx.expense_total / ctx.tx.n_months
+
+        emergency_months = ctx.emergency_months
+        portfolio_value = float(ctx.portfolio_values.sum())
+
+        return {
+            "job_loss": {
+                "scenario": "Complete income loss",
+                "months_survivable": round(emergency_months, 1),
+                "status": "resilient" if emergency_months >= 6 else "vulnerable"
+            },
+            "market_crash": {
+                "scenario": "30% portfolio decline",
+                "potential_loss": round(portfolio_value * 0.30, 2),
+                "remaining_value": round(portfolio_value * 0.70, 2)
+            },
+            "income_drop": {
+                "scenario": "50% income reduction",
+                "monthly_shortfall": round(max(0, monthly_expenses - monthly_income * 0.5), 2),
+                "status": "resilient" if monthly_income * 0.5 >= monthly_expenses else "vulnerable"
+            }
+        }
+
+    def _assess_vulnerabilities(self, ctx: RiskContext) -> List[Dict]:
+        """Identify specific financial vulnerabilities"""
+        vulnerabilities = []
+
+        if ctx.tx is not None:
+            if ctx.tx.income_source_count <= 1:
+                vulnerabilities.append(_VULN_SINGLE_INCOME)
+
+            if ctx.emergency_months < 3:
+                vulnerabilities.append(_vuln_emergency_fund(ctx.emergency_months))
+
+        if ctx.concentration > 0.4:
+            vulnerabilities.append(_vuln_concentration(ctx.concentration))
+
+        return vulnerabilities
+
+    def _generate_risk_mitigation_strategies(self, ctx: RiskContext) -> List[Dict]:
+        """Generate prioritized strategies to reduce identified risks"""
+        strategies = []
+
+        if ctx.tx is not None:
+            if ctx.emergency_months < 6:
+                strategies.append(_strategy_emergency_fund(ctx.emergency_months))
+
+            if ctx.tx.income_source_count <= 1:
+                strategies.append(_STRATEGY_DIVERSIFY_INCOME)
+
+        if ctx.concentration > 0.4:
+            strategies.append(_STRATEGY_REBALANCE)
+
+        if ctx.budget_overrun_rate > 0.25:
+            strategies.append(_STRATEGY_BUDGET_ADHERENCE)
+
+        return strategies
+
+    def _analyze_insurance_needs(self, ctx: RiskContext) -> List[Dict]:
+        """Flag insurance coverage worth reviewing given income and assets"""
+        needs = []
+
+        if ctx.tx is not None:
+            monthly_income = ctx.tx.income_total / ctx.tx.n_months
+            if monthly_income > 3000:
+                needs.append(_need_disability_insurance(monthly_income))
+
+        total_assets = float(ctx.portfolio_values.sum())
+        if total_assets > 100000:
+            needs.append(_NEED_UMBRELLA)
+
+        return needs
+
+    def _calculate_overall_risk_score(self, ctx: RiskContext) -> int:
+        """Composite 0-100 risk score across the four risk dimensions"""
+        # Branch-free: each capped sub-score is a lazy context lookup
+        # that the category analysis shares instead of recomputing
+        return min(100, int(
+            ctx.income_vol_score + ctx.liquidity_score
+            + ctx.concentration_score + ctx.budget_score
+        ))
+
+    @staticmethod
+    def _risk_level(score: int) -> str:
+        """Map a 0-100 score onto a qualitative risk level"""
+        if score >= 60:
+            return "high"
+        if score >= 30:
+            return "medium"
+        return "low"